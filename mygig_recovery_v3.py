@@ -1,8 +1,16 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import io
+import mmap
 import os
+import posixpath
+import queue
+import sqlite3
+import stat
 import sys
 import threading
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Auto-apply patch for dissect.qnxfs bugs
 def apply_qnx4_patch():
@@ -38,13 +46,33 @@ except ImportError:
 # Check for optional metadata support
 try:
     import mutagen
+    from mutagen import File as MutagenFile
     METADATA_AVAILABLE = True
 except ImportError:
     METADATA_AVAILABLE = False
 
+# Verbose scan tracing; stdout writes are measurable on the hot paths
+DEBUG = os.environ.get('MYGIG_DEBUG') == '1'
+
+def _first_tag(audio, key):
+    """Return the first value for a tag, '' when absent"""
+    values = audio.get(key)
+    return values[0] if values else ''
+
+class _NamedBytesIO(io.BytesIO):
+    """BytesIO with a name so mutagen can use the extension as a format hint"""
+
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
 class QNX4ScannerGUI:
     """GUI for QNX4 MP3 Recovery using dissect.target"""
-    
+
+    # Max rows inserted per directory at once; larger listings continue
+    # behind a "Load more" row
+    TREE_BATCH = 200
+
     def __init__(self, root):
         self.root = root
         self.root.title("QNX4 File Recovery Tool v3.0 - Complete Filesystem Browser")
@@ -53,11 +81,32 @@ class QNX4ScannerGUI:
         self.image_path = None
         self.target = None
         self.found_files = []
+        self.tree_data = {}  # Flat dir-path -> [(name, file_idx or -1)] map built during scan
         self.all_files_cache = []  # Unfiltered list for search
         self.scan_thread = None
         self.metadata_db_path = None
-        
+        self._pending = {}  # Treeview node id -> not-yet-inserted subtree dict
+        self._more_offsets = {}  # "Load more" row id -> remaining entries
+        self._dir_counter = 0  # Generates "d<N>" Treeview ids for directories
+        self._paths_sorted = []  # File paths sorted for prefix-range lookups
+        self._sorted_idx = []  # Maps sorted position -> found_files index
+        self._search_strings = []  # Lowercased haystacks, parallel to found_files
+        self._filter_active = False
+        self._filter_matches = set()  # File indices matching the active filter
+        self._filter_after_id = None  # Pending debounced filter callback
+
+        # Worker threads drop status updates here; _pump_ui applies them
+        # on the Tk thread at ~10 Hz instead of one event per update
+        self._ui_state = {}
+        self._ui_last = {}  # Last applied values; skip no-op Tcl calls
+        self._ui_lock = threading.Lock()
+
+        # The dissect filesystem shares one image handle; every worker
+        # thread must serialize its reads on this lock
+        self._image_lock = threading.Lock()
+
         self.create_widgets()
+        self._pump_ui()
     
     def create_widgets(self):
         # Top frame
@@ -84,7 +133,7 @@ class QNX4ScannerGUI:
             
             ttk.Label(search_frame, text="Search:").pack(side=tk.LEFT)
             self.search_var = tk.StringVar()
-            self.search_var.trace('w', lambda *args: self.filter_tree())
+            self.search_var.trace('w', lambda *args: self._schedule_filter())
             search_entry = ttk.Entry(search_frame, textvariable=self.search_var, width=50)
             search_entry.pack(side=tk.LEFT, padx=5)
             ttk.Label(search_frame, text="(searches name, path, title, artist, album, bitrate)", foreground="gray").pack(side=tk.LEFT)
@@ -94,12 +143,12 @@ class QNX4ScannerGUI:
         self.progress_bar = ttk.Progressbar(self.root, variable=self.progress_var, maximum=100)
         self.progress_bar.pack(fill=tk.X, padx=10, pady=5)
         
-        # Status labels
-        self.status_var = tk.StringVar(value="Complete QNX4 filesystem browser - Extract any file type with full data integrity")
-        ttk.Label(self.root, textvariable=self.status_var, foreground="blue").pack()
+        # Status labels; configured directly, no StringVar trace layer
+        self.status_label = ttk.Label(self.root, text="Complete QNX4 filesystem browser - Extract any file type with full data integrity", foreground="blue")
+        self.status_label.pack()
         
-        self.count_var = tk.StringVar(value="")
-        ttk.Label(self.root, textvariable=self.count_var, font=('Arial', 10, 'bold')).pack(pady=5)
+        self.count_label = ttk.Label(self.root, text="", font=('Arial', 10, 'bold'))
+        self.count_label.pack(pady=5)
         
         # Results frame
         results_frame = ttk.Frame(self.root, padding="10")
@@ -117,18 +166,19 @@ class QNX4ScannerGUI:
         self.tree.heading('Bitrate', text='Bitrate')
         self.tree.heading('Path', text='Full Path')
         
-        self.tree.column('#0', width=300)
-        self.tree.column('Size', width=80)
+        self.tree.column('#0', width=500)
+        self.tree.column('Size', width=100)
         self.tree.column('Title', width=200)
         self.tree.column('Artist', width=150)
         self.tree.column('Album', width=150)
         self.tree.column('Bitrate', width=80)
-        self.tree.column('Path', width=300)
-        
-        self.tree.column('#0', width=500)
-        self.tree.column('Size', width=100)
         self.tree.column('Path', width=500)
-        
+
+        # Populate directory contents lazily on first expand
+        self.tree.bind('<<TreeviewOpen>>', self._on_expand)
+        # Double-clicking a "Load more" row inserts the next batch
+        self.tree.bind('<Double-1>', self._on_more_click)
+
         scrollbar = ttk.Scrollbar(results_frame, orient=tk.VERTICAL, command=self.tree.yview)
         self.tree.configure(yscrollcommand=scrollbar.set)
         
@@ -159,13 +209,19 @@ class QNX4ScannerGUI:
             messagebox.showerror("Error", "Please select a valid disk image file")
             return
         
-        # Clear previous results
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear previous results; stale filter state must not survive a
+        # rescan or folder selections would intersect with old indices
+        self._clear_tree()
         self.found_files = []
-        
-        self.status_var.set("Opening image with dissect.target...")
-        self.count_var.set("")
+        self.tree_data = {}
+        self._paths_sorted = []
+        self._sorted_idx = []
+        self._search_strings = []
+        self._filter_active = False
+        self._filter_matches = set()
+
+        self.status_label.configure(text="Opening image with dissect.target...")
+        self.count_label.configure(text="")
         self.progress_var.set(0)
         
         self.scan_button.config(state='disabled')
@@ -181,29 +237,62 @@ class QNX4ScannerGUI:
             return None
         return self.image_path + ".metadata.db"
     
+    def _open_db(self, db_path):
+        """Open the metadata cache database with tuned PRAGMAs
+
+        WAL plus synchronous=NORMAL drops the two fsyncs per commit of the
+        default rollback journal; if WAL is unavailable (e.g. the image
+        sits on a network share) fall back to an in-memory journal.
+
+        isolation_level=None disables the sqlite3 module's implicit
+        transaction heuristic; bulk statements manage their own
+        BEGIN/COMMIT so a batch is guaranteed to be one transaction.
+        """
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        # The pragma reports the mode actually in effect rather than
+        # raising; check it so the fallback really engages
+        mode = conn.execute("PRAGMA journal_mode=WAL").fetchone()
+        if not mode or mode[0].lower() != 'wal':
+            conn.execute("PRAGMA journal_mode=MEMORY")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        return conn
+
     def load_metadata_cache(self):
         """Load metadata from SQLite cache if exists"""
-        import sqlite3
-        
         db_path = self.get_db_path()
         if not db_path or not os.path.exists(db_path):
             return {}
-        
+
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._open_db(db_path)
             cursor = conn.cursor()
-            cursor.execute("SELECT path, title, artist, album, bitrate FROM metadata")
-            
+
+            # Join against the current scan's paths so the result is
+            # bounded by this image, not by everything ever cached, and
+            # iterate the cursor instead of materializing fetchall()
+            cursor.execute("CREATE TEMP TABLE current_paths (p TEXT PRIMARY KEY)")
+            cursor.execute("BEGIN")
+            cursor.executemany(
+                "INSERT OR IGNORE INTO current_paths VALUES (?)",
+                ((file_info['path'],) for file_info in self.found_files)
+            )
+            cursor.execute("COMMIT")
+            cursor.execute("""
+                SELECT m.path, m.title, m.artist, m.album, m.bitrate
+                FROM metadata m JOIN current_paths c ON c.p = m.path
+            """)
+
             metadata_cache = {}
-            for row in cursor.fetchall():
-                path, title, artist, album, bitrate = row
+            for path, title, artist, album, bitrate in cursor:
                 metadata_cache[path] = {
                     'title': title or '',
                     'artist': artist or '',
                     'album': album or '',
                     'bitrate': bitrate or ''
                 }
-            
+
             conn.close()
             self.update_status(f"✓ Loaded cached metadata from {os.path.basename(db_path)}")
             return metadata_cache
@@ -213,14 +302,12 @@ class QNX4ScannerGUI:
     
     def save_metadata_cache(self):
         """Save metadata to SQLite cache"""
-        import sqlite3
-        
         db_path = self.get_db_path()
         if not db_path:
             return
-        
+
         try:
-            conn = sqlite3.connect(db_path)
+            conn = self._open_db(db_path)
             cursor = conn.cursor()
             
             # Create table
@@ -234,20 +321,31 @@ class QNX4ScannerGUI:
                 )
             """)
             
-            # Insert metadata
-            for file_info in self.found_files:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO metadata (path, title, artist, album, bitrate)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            # Insert metadata in one batched statement/transaction instead
+            # of a per-row execute (and per-row fsync on commit-happy setups)
+            rows = (
+                (
                     file_info['path'],
                     file_info.get('title', ''),
                     file_info.get('artist', ''),
                     file_info.get('album', ''),
                     file_info.get('bitrate', '')
-                ))
-            
-            conn.commit()
+                )
+                for file_info in self.found_files
+            )
+            # One explicit transaction for the whole batch; IMMEDIATE takes
+            # the write lock up front instead of mid-batch
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.executemany("""
+                    INSERT OR REPLACE INTO metadata (path, title, artist, album, bitrate)
+                    VALUES (?, ?, ?, ?, ?)
+                """, rows)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+
             conn.close()
             print(f"✓ Saved metadata cache to {db_path}")
         except Exception as e:
@@ -257,42 +355,47 @@ class QNX4ScannerGUI:
         """Extract metadata from a single file using mutagen"""
         if not METADATA_AVAILABLE:
             return
-        
-        from mutagen import File as MutagenFile
-        
+
         try:
-            # Read file data into memory
-            with file_info['entry'].open() as fh:
-                data = fh.read()
-            
-            # Write to temp file for mutagen
-            import tempfile
-            with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file_info['name'])[1]) as tmp:
-                tmp.write(data)
-                tmp_path = tmp.name
-            
-            try:
-                # Extract metadata
-                audio = MutagenFile(tmp_path, easy=True)
-                
-                if audio is not None:
-                    # Get title, artist, album
-                    file_info['title'] = audio.get('title', [''])[0] if hasattr(audio, 'get') else ''
-                    file_info['artist'] = audio.get('artist', [''])[0] if hasattr(audio, 'get') else ''
-                    file_info['album'] = audio.get('album', [''])[0] if hasattr(audio, 'get') else ''
-                    
-                    # Get bitrate
-                    if hasattr(audio.info, 'bitrate'):
-                        file_info['bitrate'] = f"{audio.info.bitrate // 1000} kbps"
+            # Read file data into memory (image reads are serialized;
+            # the mutagen parse below runs outside the lock). MP3 tags
+            # sit at the ends of the file - ID3v2 header up front,
+            # ID3v1/APE trailer at the back - so for large MP3s only
+            # pull those instead of dragging whole files through the
+            # image. Other formats (e.g. MP4/M4A keep the moov atom at
+            # the end) need the full file to parse reliably.
+            size = file_info['size']
+            is_mp3 = file_info['name'].lower().endswith('.mp3')
+            with self._image_lock:
+                with file_info['entry'].open() as fh:
+                    if is_mp3 and size >= 262144:
+                        head = fh.read(131072)
+                        fh.seek(size - 128)
+                        data = head + fh.read(128)
                     else:
-                        file_info['bitrate'] = ''
+                        data = fh.read()
+            
+            # Parse in memory; mutagen accepts file-like objects, so there
+            # is no temp-file write/read/unlink round trip per file
+            audio = MutagenFile(_NamedBytesIO(data, file_info['name']), easy=True)
+
+            if audio is not None:
+                # Get title, artist, album; every easy-mode mutagen type
+                # exposes Mapping-style get, so no hasattr checks needed
+                file_info['title'] = _first_tag(audio, 'title')
+                file_info['artist'] = _first_tag(audio, 'artist')
+                file_info['album'] = _first_tag(audio, 'album')
+
+                # Get bitrate
+                if hasattr(audio.info, 'bitrate'):
+                    file_info['bitrate'] = f"{audio.info.bitrate // 1000} kbps"
                 else:
-                    file_info['title'] = ''
-                    file_info['artist'] = ''
-                    file_info['album'] = ''
                     file_info['bitrate'] = ''
-            finally:
-                os.unlink(tmp_path)
+            else:
+                file_info['title'] = ''
+                file_info['artist'] = ''
+                file_info['album'] = ''
+                file_info['bitrate'] = ''
         except Exception as e:
             # Not an audio file or failed to read
             file_info['title'] = ''
@@ -328,30 +431,39 @@ class QNX4ScannerGUI:
         cached = 0
         
         try:
+            # Cache hits are cheap dict lookups; apply them up front and
+            # only send the misses to the worker pool
+            uncached = []
             for file_info in self.found_files:
-                # Check cache first
                 if file_info['path'] in metadata_cache:
                     file_info.update(metadata_cache[file_info['path']])
                     cached += 1
                 else:
-                    self.extract_metadata_from_file(file_info)
-                
-                processed += 1
-                
-                # Update progress
-                progress = int((processed / total) * 100)
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-                self.root.after(0, lambda n=processed, t=total: 
-                    self.status_var.set(f"Extracting metadata: {n}/{t} files ({cached} from cache)"))
-            
+                    uncached.append(file_info)
+
+            processed = cached
+            self.update_progress(int((processed / total) * 100) if total else 100)
+
+            # Image reads and the mutagen parse both release the GIL, so
+            # the misses parallelize across a thread pool
+            if uncached:
+                with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+                    futures = [executor.submit(self.extract_metadata_from_file, fi) for fi in uncached]
+                    for future in as_completed(futures):
+                        processed += 1
+
+                        # Update progress
+                        self.update_progress(int((processed / total) * 100))
+                        self.update_status(f"Extracting metadata: {processed}/{total} files ({cached} from cache)")
+
             # Save cache
             self.save_metadata_cache()
-            
+
             # Refresh tree view
             self.root.after(0, self.refresh_tree_with_metadata)
-            
-            self.root.after(0, lambda: self.status_var.set(f"✓ Metadata extraction complete! ({cached} from cache, {total - cached} extracted)"))
-            self.root.after(0, lambda: self.progress_var.set(100))
+
+            self.update_status(f"✓ Metadata extraction complete! ({cached} from cache, {total - cached} extracted)")
+            self.update_progress(100)
         except Exception as e:
             self.root.after(0, lambda: messagebox.showerror("Error", f"Metadata extraction failed: {str(e)}"))
             import traceback
@@ -362,34 +474,31 @@ class QNX4ScannerGUI:
     
     def refresh_tree_with_metadata(self):
         """Refresh tree view to show metadata"""
-        # Clear and repopulate
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        self.populate_tree()
+        # New tags go into the search haystacks and cached row tuples
+        self._build_search_strings()
+        for file_info in self.found_files:
+            file_info.pop('_row', None)
 
-    def filter_tree(self):
-        """Filter tree view based on search query"""
-        query = self.search_var.get().lower()
-        
-        if not query:
-            # Show all - repopulate
-            for item in self.tree.get_children():
-                self.tree.delete(item)
+        # Re-apply any active search so the displayed tree and the
+        # filter match set stay in sync with the new metadata; with an
+        # empty query filter_tree repopulates the full tree and clears
+        # the filter state
+        if getattr(self, 'search_var', None) is not None and self.search_var.get():
+            self.filter_tree()
+        else:
+            self._filter_active = False
+            self._filter_matches = set()
+            self._clear_tree()
             self.populate_tree()
-            self.count_var.set(f"✓ {len(self.found_files)} files")
-            return
-        
-        # Clear tree
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Build filtered tree
-        filtered_data = {}
-        
-        for idx, file_info in enumerate(self.found_files):
-            # Search in all fields
-            searchable = ' '.join([
+
+    def _build_search_strings(self):
+        """Rebuild the lowercased search haystacks as one flat list
+
+        A plain list of strings parallel to found_files keeps the filter
+        scan a contiguous iteration with no per-file dict lookups.
+        """
+        self._search_strings = [
+            ' '.join([
                 file_info['name'],
                 file_info['path'],
                 file_info.get('title', ''),
@@ -397,109 +506,252 @@ class QNX4ScannerGUI:
                 file_info.get('album', ''),
                 file_info.get('bitrate', '')
             ]).lower()
-            
+            for file_info in self.found_files
+        ]
+
+    def _schedule_filter(self):
+        """Debounce search keystrokes; rebuild at most once per 150 ms"""
+        if self._filter_after_id is not None:
+            self.root.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.root.after(150, self.filter_tree)
+
+    def filter_tree(self):
+        """Filter tree view based on search query"""
+        self._filter_after_id = None
+        query = self.search_var.get().lower()
+        self._filter_active = bool(query)
+
+        if not query:
+            # Show all - repopulate
+            self._filter_matches = set()
+            self._clear_tree()
+            self.populate_tree()
+            self.count_label.configure(text=f"✓ {len(self.found_files)} files")
+            return
+
+        # Clear tree
+        self._clear_tree()
+
+        # Collect matching files and the directories containing them; the
+        # cached tree_data is then walked with these as a filter instead
+        # of rebuilding a second tree structure per query
+        matches = set()
+        matched_dirs = set()
+
+        if len(self._search_strings) != len(self.found_files):
+            self._build_search_strings()
+
+        for idx, searchable in enumerate(self._search_strings):
             if query in searchable:
-                # Add to filtered tree
-                path = file_info['path']
-                parts = path.strip('/').split('/')
-                
-                current = filtered_data
-                for i, part in enumerate(parts[:-1]):
-                    if part not in current:
-                        current[part] = {'_dirs': {}, '_files': []}
-                    current = current[part]['_dirs']
-                
-                filename = parts[-1]
-                if filename not in current:
-                    current[filename] = {'_dirs': {}, '_files': []}
-                current[filename]['_files'].append(idx)
-        
+                matches.add(idx)
+                parent = ''
+                for part in self.found_files[idx]['parts'][:-1]:
+                    parent = f"{parent}/{part}"
+                    matched_dirs.add(parent)
+
         # Populate filtered tree (with auto-expand)
-        self._add_tree_nodes(filtered_data, '', auto_expand=True)
-        
+        self._filter_matches = matches
+        self._add_tree_nodes(self.tree_data, '', auto_expand=True,
+                             filter_idx=matches, filter_dirs=matched_dirs)
+
         # Update status
-        matched_count = sum(1 for f in self.found_files if query in ' '.join([
-            f['name'], f['path'], f.get('title', ''), f.get('artist', ''), 
-            f.get('album', ''), f.get('bitrate', '')
-        ]).lower())
-        self.count_var.set(f"Showing {matched_count} of {len(self.found_files)} files")
+        self.count_label.configure(text=f"Showing {len(matches)} of {len(self.found_files)} files")
+
+    @staticmethod
+    def _open_image(path):
+        """Open the disk image read-only, memory-mapped when possible
+
+        mmap turns dissect's many small seek+read pairs into page-cache
+        slices without a syscall and copy per call. Falls back to a
+        regular buffered file if the mapping fails.
+        """
+        fh = open(path, 'rb')
+        try:
+            mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError) as e:
+            if DEBUG:
+                print(f"DEBUG: mmap failed, using buffered reads: {e}")
+            return fh
+
+        fh.close()
+
+        # Traversal is random-access; tell the kernel not to read ahead
+        if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_RANDOM'):
+            mm.madvise(mmap.MADV_RANDOM)
+
+        return mm
+
+    def _open_qnx4_direct(self, path):
+        """Open the QNX4 filesystem directly when it starts at offset 0
+
+        Target.open probes every loader and filesystem plugin dissect
+        ships; an unpartitioned MyGig image only needs the QNX4 driver.
+        Returns None if the magic check fails (e.g. partitioned image),
+        in which case the caller falls back to Target.open.
+        """
+        try:
+            from dissect.target.filesystems.qnxfs import QnxFilesystem
+
+            fh = self._open_image(path)
+            if QnxFilesystem.detect(fh):
+                return QnxFilesystem(fh)
+            fh.close()
+        except Exception as e:
+            if DEBUG:
+                print(f"DEBUG: Direct QNX4 open failed: {e}")
+        return None
 
     def scan_worker(self):
         """Background scanning thread using dissect.target"""
         try:
             self.update_status("Opening disk image...")
             self.update_progress(10)
-            
-            # Open target
-            self.target = Target.open(self.image_path)
-            
+
+            # Fast path: QNX4 filesystem at offset 0, no plugin detection
+            direct_fs = self._open_qnx4_direct(self.image_path)
+
             self.update_status("Detecting QNX4 filesystems...")
             self.update_progress(20)
-            
-            # Find QNX4 filesystem(s)
-            qnx_filesystems = [fs for fs in self.target.filesystems if fs.__type__ == 'qnxfs']
-            
-            if not qnx_filesystems:
-                raise Exception("No QNX4 filesystem found in image")
-            
+
+            if direct_fs is not None:
+                qnx_filesystems = [direct_fs]
+                root = direct_fs.path("/")
+            else:
+                # Partitioned or wrapped image: let dissect probe it
+                self.target = Target.open(self.image_path)
+
+                # Find QNX4 filesystem(s)
+                qnx_filesystems = [fs for fs in self.target.filesystems if fs.__type__ == 'qnxfs']
+
+                if not qnx_filesystems:
+                    raise Exception("No QNX4 filesystem found in image")
+
+                # Always scan from root to get entire filesystem
+                root = self.target.fs.path("/")
+
             self.update_status(f"Found {len(qnx_filesystems)} QNX4 filesystem(s)")
-            print(f"DEBUG: Found {len(qnx_filesystems)} QNX filesystems")
+            if DEBUG:
+                print(f"DEBUG: Found {len(qnx_filesystems)} QNX filesystems")
             self.update_progress(30)
-            
-            # Scan for all files from root
-            all_files = []
-            
-            # Always scan from root to get entire filesystem
-            root = self.target.fs.path("/")
-            print(f"DEBUG: Scanning entire filesystem from root /")
-            
+
+            if DEBUG:
+                print(f"DEBUG: Scanning entire filesystem from root /")
+
             self.update_status(f"Scanning entire filesystem from /")
             self.update_progress(40)
-            
-            # Recursively scan for all files
-            file_count = 0
-            try:
-                for entry in root.rglob("*"):
+
+            # Recursively scan for all files with a single stack-based walk.
+            # Each entry is stat'd exactly once: st_mode tells us file vs
+            # directory, so there is no second is_file()/stat() pass.
+            # The walk (image I/O) runs in a producer thread while this
+            # thread does the Python bookkeeping, so directory reads
+            # overlap with tree/dict building.
+            entry_queue = queue.Queue(maxsize=64)
+
+            def walk_producer():
+                stack = [root]
+                while stack:
+                    directory = stack.pop()
                     try:
-                        if entry.is_file():
-                            all_files.append(entry)
-                            file_count += 1
-                            
-                            if file_count % 100 == 0:
-                                print(f"DEBUG: Found {file_count} files so far...")
-                                self.update_status(f"Found {file_count} files...")
-                                progress = 40 + int((file_count / 2000) * 30)
-                                self.update_progress(min(progress, 70))
+                        for entry in directory.iterdir():
+                            try:
+                                size = mtime = inum = None
+
+                                # Fast path: read type/size/mtime straight off
+                                # the QNX4 inode instead of building a full
+                                # stat_result per entry
+                                try:
+                                    inode = entry.get().entry
+                                    if not inode.is_symlink():
+                                        if inode.is_dir():
+                                            stack.append(entry)
+                                            continue
+                                        if not inode.is_file():
+                                            continue
+                                        size = inode.size
+                                        mtime = inode.inode.di_mtime
+                                        inum = inode.inum
+                                except AttributeError:
+                                    pass
+
+                                if size is None:
+                                    # Symlink or non-QNX4 entry: full stat,
+                                    # which follows links
+                                    stat_info = entry.stat()
+                                    if stat.S_ISDIR(stat_info.st_mode):
+                                        # Never descend through a symlink:
+                                        # a link cycle (x -> .) would walk
+                                        # forever, and rglob did not
+                                        # follow them either
+                                        if not entry.is_symlink():
+                                            stack.append(entry)
+                                        continue
+                                    if not stat.S_ISREG(stat_info.st_mode):
+                                        continue
+                                    size = stat_info.st_size
+                                    mtime = stat_info.st_mtime
+                                    inum = getattr(stat_info, 'st_ino', 0)
+
+                                entry_queue.put((entry, size, mtime, inum))
+                            except Exception as e:
+                                if DEBUG:
+                                    print(f"DEBUG: Error reading entry: {e}")
+                                pass
                     except Exception as e:
-                        print(f"DEBUG: Error checking entry: {e}")
+                        if DEBUG:
+                            print(f"DEBUG: Error listing directory: {e}")
                         pass
-            except Exception as e:
-                print(f"DEBUG: Error during rglob: {e}")
-                import traceback
-                traceback.print_exc()
-            
-            print(f"DEBUG: Total files found: {len(all_files)}")
-            
+                entry_queue.put(None)  # Sentinel: walk finished
+
+            producer = threading.Thread(target=walk_producer, daemon=True)
+            producer.start()
+
+            file_count = 0
+            while True:
+                item = entry_queue.get()
+                if item is None:
+                    break
+
+                entry, size, mtime, inum = item
+                path = str(entry)
+                parts = tuple(path.strip('/').split('/'))
+                file_idx = len(self.found_files)
+                self.found_files.append({
+                    'entry': entry,
+                    'path': path,
+                    'parts': parts,
+                    'name': entry.name,
+                    'size': size,
+                    'size_mb_str': f"{size / 1048576:.2f}",
+                    'mtime': mtime,
+                    'inode': inum
+                })
+                self._tree_insert(self.tree_data, parts, file_idx)
+                file_count += 1
+
+                if file_count % 500 == 0:
+                    if DEBUG:
+                        print(f"DEBUG: Found {file_count} files so far...")
+                    self.update_status(f"Found {file_count} files...")
+                    progress = 40 + int((file_count / 2000) * 30)
+                    self.update_progress(min(progress, 70))
+
+            producer.join()
+
+            if DEBUG:
+                print(f"DEBUG: Total files found: {len(self.found_files)}")
+
+            # Sorted path index: a directory's descendants form a
+            # contiguous range, so selections resolve via bisect instead
+            # of walking Treeview nodes
+            order = sorted(range(len(self.found_files)), key=lambda i: self.found_files[i]['path'])
+            self._sorted_idx = order
+            self._paths_sorted = [self.found_files[i]['path'] for i in order]
+            self._build_search_strings()
+
             self.update_status("Building file tree...")
             self.update_progress(75)
             
-            # Store files with metadata
-            for entry in all_files:
-                try:
-                    stat_info = entry.stat()
-                    self.found_files.append({
-                        'entry': entry,
-                        'path': str(entry),
-                        'name': entry.name,
-                        'size': stat_info.st_size,
-                        'mtime': stat_info.st_mtime
-                    })
-                except Exception as e:
-                    print(f"DEBUG: Error getting file info: {e}")
-                    pass
-            
-            print(f"DEBUG: Files with metadata: {len(self.found_files)}")
-            
             # Build tree structure
             self.update_status("Populating tree view...")
             self.root.after(0, self.populate_tree)
@@ -524,75 +776,196 @@ class QNX4ScannerGUI:
             if METADATA_AVAILABLE:
                 self.root.after(0, lambda: self.metadata_button.config(state='normal'))
     
+    @staticmethod
+    def _tree_insert(children, parts, file_idx):
+        """Record a file in the flat dir-path -> children map
+
+        One dict keyed by directory path replaces the nested per-level
+        dicts: far fewer small allocations and O(1) lookups per level.
+        Directories appear in their parent's list with index -1.
+        """
+        parent = ''
+        for part in parts[:-1]:
+            child_path = f"{parent}/{part}"
+            if child_path not in children:
+                children[child_path] = []
+                children.setdefault(parent, []).append((part, -1))
+            parent = child_path
+
+        children.setdefault(parent, []).append((parts[-1], file_idx))
+
     def populate_tree(self):
-        """Populate treeview with hierarchical directory structure"""
-        # Build directory tree
-        tree_data = {}
-        
-        for idx, file_info in enumerate(self.found_files):
-            path = file_info['path']
-            parts = path.strip('/').split('/')
-            
-            current = tree_data
-            for i, part in enumerate(parts[:-1]):
-                if part not in current:
-                    current[part] = {'_dirs': {}, '_files': []}
-                current = current[part]['_dirs']
-            
-            # Add file
-            filename = parts[-1]
-            if filename not in current:
-                current[filename] = {'_dirs': {}, '_files': []}
-            current[filename]['_files'].append(idx)
-        
-        # Populate tree
-        self._add_tree_nodes(tree_data, '')
+        """Populate treeview from the tree built during scan"""
+        self._add_tree_nodes(self.tree_data, '')
     
-    def _add_tree_nodes(self, tree_data, parent='', auto_expand=False):
-        """Recursively add nodes to treeview"""
-        for name in sorted(tree_data.keys()):
-            node = tree_data[name]
-            file_indices = node.get('_files', [])
-            subdirs = node.get('_dirs', {})
-            
-            if file_indices:
-                # This is a file
-                file_idx = file_indices[0]
-                file_info = self.found_files[file_idx]
-                
-                self.tree.insert(parent, 'end',
-                    text=name,
-                    values=(
-                        f"{file_info['size'] / (1024*1024):.2f}",
-                        file_info.get('title', ''),
-                        file_info.get('artist', ''),
-                        file_info.get('album', ''),
-                        file_info.get('bitrate', ''),
-                        file_info['path']
-                    ),
-                    tags=('file', str(file_idx))
-                )
-            
-            if subdirs:
-                # This is a directory
-                dir_node = self.tree.insert(parent, 'end',
-                    text=f"📁 {name}",
-                    values=('', '', '', '', '', ''),
-                    tags=('directory',),
-                    open=auto_expand  # Expand during search, collapse normally
-                )
-                
-                # Recursively add children
-                self._add_tree_nodes(subdirs, parent=dir_node, auto_expand=auto_expand)
+    def _add_tree_nodes(self, children, parent='', auto_expand=False, dir_path='',
+                        filter_idx=None, filter_dirs=None):
+        """Iteratively add nodes to treeview from a flat children map
+
+        filter_idx/filter_dirs restrict the walk to matching files and
+        the directories whose subtrees contain them (search results).
+        """
+        work = [(parent, dir_path)]
+        while work:
+            parent_id, path = work.pop()
+
+            entries = sorted(children.get(path, []))
+
+            # Huge flat directories insert in slices; the rest hides
+            # behind a "Load more" row instead of stalling the UI thread
+            if not auto_expand and len(entries) > self.TREE_BATCH:
+                self._insert_batch(children, parent_id, path, entries, 0)
+                continue
+
+            for name, file_idx in entries:
+                if file_idx >= 0:
+                    if filter_idx is not None and file_idx not in filter_idx:
+                        continue
+                    self._insert_file(parent_id, name, file_idx)
+                else:
+                    child_path = f"{path}/{name}"
+                    if filter_dirs is not None and child_path not in filter_dirs:
+                        continue  # No matches anywhere in this subtree
+                    dir_node = self._insert_dir(parent_id, name, child_path, auto_expand)
+
+                    if auto_expand:
+                        # Search results: materialize the whole subtree
+                        work.append((dir_node, child_path))
+                    else:
+                        # Lazy population: a placeholder child keeps the expand
+                        # arrow, the real subtree is inserted on <<TreeviewOpen>>
+                        self.tree.insert(dir_node, 'end', text='...')
+                        self._pending[dir_node] = (children, child_path)
+
+    def _insert_file(self, parent_id, name, file_idx):
+        """Insert one file row"""
+        file_info = self.found_files[file_idx]
+
+        # Column values are built once per file and reused by
+        # every later rebuild (filter keystrokes, refreshes)
+        row = file_info.get('_row')
+        if row is None:
+            row = (
+                file_info['size_mb_str'],
+                file_info.get('title', ''),
+                file_info.get('artist', ''),
+                file_info.get('album', ''),
+                file_info.get('bitrate', ''),
+                file_info['path']
+            )
+            file_info['_row'] = row
+
+        # File index lives in the item id ("f<idx>") so selection
+        # handling recovers it without scanning tags
+        self.tree.insert(parent_id, 'end',
+            iid=f"f{file_idx}",
+            text=name,
+            values=row,
+            tags=('file',)
+        )
+
+    def _insert_dir(self, parent_id, name, child_path, auto_expand):
+        """Insert one directory row; its full path goes in the Path
+        column so selections can do a prefix-range lookup"""
+        self._dir_counter += 1
+        return self.tree.insert(parent_id, 'end',
+            iid=f"d{self._dir_counter}",
+            text=f"📁 {name}",
+            values=('', '', '', '', '', child_path),
+            tags=('directory',),
+            open=auto_expand  # Expand during search, collapse normally
+        )
+
+    def _insert_batch(self, children, parent_id, path, entries, offset):
+        """Insert one slice of a large directory plus a Load-more row"""
+        for name, file_idx in entries[offset:offset + self.TREE_BATCH]:
+            if file_idx >= 0:
+                self._insert_file(parent_id, name, file_idx)
+            else:
+                child_path = f"{path}/{name}"
+                dir_node = self._insert_dir(parent_id, name, child_path, False)
+                self.tree.insert(dir_node, 'end', text='...')
+                self._pending[dir_node] = (children, child_path)
+
+        next_offset = offset + self.TREE_BATCH
+        if next_offset < len(entries):
+            more = self.tree.insert(parent_id, 'end',
+                text=f"⋯ Load more ({len(entries) - next_offset} remaining)",
+                tags=('more',)
+            )
+            self._more_offsets[more] = (children, path, entries, next_offset)
+
+    def _on_more_click(self, event):
+        """Materialize the next slice of a large directory on double-click"""
+        item = self.tree.identify_row(event.y)
+        info = self._more_offsets.pop(item, None)
+        if info is None:
+            return
+
+        children, path, entries, offset = info
+        parent_id = self.tree.parent(item)
+        self.tree.delete(item)
+        self._insert_batch(children, parent_id, path, entries, offset)
+
+    def _on_expand(self, event):
+        """Materialize a lazily-populated directory on first expand"""
+        item = self.tree.focus()
+        pending = self._pending.pop(item, None)
+        if pending is None:
+            return
+
+        children, dir_path = pending
+
+        # Remove the placeholder, then insert the real children
+        for child in self.tree.get_children(item):
+            self.tree.delete(child)
+
+        # Detach the node during the bulk insert so Tk does not
+        # re-layout the visible tree after every row, then put it back
+        parent_id = self.tree.parent(item)
+        index = self.tree.index(item)
+        self.tree.detach(item)
+        try:
+            self._add_tree_nodes(children, parent=item, dir_path=dir_path)
+        finally:
+            self.tree.move(item, parent_id, index)
+
+    def _clear_tree(self):
+        """Remove all Treeview nodes and any pending lazy subtrees"""
+        for item in self.tree.get_children():
+            self.tree.delete(item)
+        self._pending.clear()
+        self._more_offsets.clear()
+        self._dir_counter = 0
     
+    def _pump_ui(self):
+        """Apply pending worker status updates on the Tk thread"""
+        with self._ui_lock:
+            state, self._ui_state = self._ui_state, {}
+
+        if 'status' in state and state['status'] != self._ui_last.get('status'):
+            self.status_label.configure(text=state['status'])
+            self._ui_last['status'] = state['status']
+        if 'count' in state and state['count'] != self._ui_last.get('count'):
+            self.count_label.configure(text=state['count'])
+            self._ui_last['count'] = state['count']
+        if 'progress' in state and state['progress'] != self._ui_last.get('progress'):
+            self.progress_var.set(state['progress'])
+            self._ui_last['progress'] = state['progress']
+
+        self.root.after(100, self._pump_ui)
+
     def update_progress(self, value):
-        self.root.after(0, lambda: self.progress_var.set(value))
-    
+        with self._ui_lock:
+            self._ui_state['progress'] = value
+
     def update_status(self, message):
-        self.root.after(0, lambda: self.status_var.set(message))
-    
+        with self._ui_lock:
+            self._ui_state['status'] = message
+
     def update_count(self, message):
-        self.root.after(0, lambda: self.count_var.set(message))
+        with self._ui_lock:
+            self._ui_state['count'] = message
     
     def extract_selected(self):
         """Extract selected files/folders"""
@@ -606,51 +979,33 @@ class QNX4ScannerGUI:
             return
         
         # Determine if extracting directories or individual files
-        has_directories = any('directory' in self.tree.item(item, 'tags') for item in selection)
-        
-        # Collect file indices and paths
+        has_directories = any(item.startswith('d') for item in selection)
+
+        # Collect file indices straight from the item ids
         file_indices = []
-        all_paths = []
-        
+
         for item in selection:
-            tags = self.tree.item(item, 'tags')
-            if 'directory' in tags:
-                dir_files = self._get_files_in_tree_node(item)
-                file_indices.extend(dir_files)
-                
-                # Collect paths for base path calculation
-                for idx in dir_files:
-                    all_paths.append(self.found_files[idx]['path'])
-            else:
-                # Get file index from tags
-                for tag in tags:
-                    if tag.isdigit():
-                        file_indices.append(int(tag))
-                        all_paths.append(self.found_files[int(tag)]['path'])
-        
+            if item.startswith('d'):
+                file_indices.extend(self._get_files_in_tree_node(item))
+            elif item.startswith('f'):
+                file_indices.append(int(item[1:]))
+
         if not file_indices:
             messagebox.showinfo("Info", "No files to extract")
             return
-        
+
         # Calculate base path to strip (common parent for all selected paths)
         base_path_to_strip = None
-        if has_directories and all_paths:
-            # Find common parent directory
-            path_parts_list = [p.strip('/').split('/') for p in all_paths]
-            
-            # Find common prefix
-            common_parts = []
-            for i in range(min(len(parts) for parts in path_parts_list)):
-                parts_at_i = [parts[i] for parts in path_parts_list]
-                if len(set(parts_at_i)) == 1:
-                    common_parts.append(parts_at_i[0])
-                else:
-                    break
-            
-            # The base path is everything except the last common part (the selected folder)
-            if len(common_parts) > 1:
-                base_path_to_strip = '/' + '/'.join(common_parts[:-1])
-            else:
+        if has_directories:
+            # One C-level pass over the paths instead of a per-depth
+            # column scan; posixpath because image paths are always
+            # '/'-separated regardless of host OS. The base is everything
+            # above the deepest common component (the selected folder).
+            common = posixpath.commonpath(
+                [self.found_files[idx]['path'] for idx in file_indices]
+            )
+            base_path_to_strip = posixpath.dirname(common)
+            if base_path_to_strip == '/':
                 base_path_to_strip = ''
         
         # Disable buttons during extraction
@@ -665,18 +1020,46 @@ class QNX4ScannerGUI:
         extract_thread.start()
     
     def _get_files_in_tree_node(self, node):
-        """Recursively get all file indices under a tree node"""
+        """Get all file indices under a directory tree node"""
+        dir_path = self.tree.set(node, 'Path')
+        if dir_path:
+            # Descendants are a contiguous range of the sorted path list;
+            # under an active filter, intersect with the match set so only
+            # visible files extract - no Treeview walk either way
+            prefix = dir_path.rstrip('/') + '/'
+            lo = bisect_left(self._paths_sorted, prefix)
+            hi = bisect_left(self._paths_sorted, prefix + '\uffff')
+            subtree = self._sorted_idx[lo:hi]
+            if self._filter_active:
+                matches = self._filter_matches
+                return [i for i in subtree if i in matches]
+            return subtree
+
+        # Fallback: walk the Treeview (directory without a Path value)
         indices = []
+
+        # Collapsed directories only hold a placeholder; their real
+        # contents still live in the pending subtree dict
+        pending = self._pending.get(node)
+        if pending is not None:
+            self._collect_subtree_indices(pending[0], pending[1], indices)
+            return indices
+
         for child in self.tree.get_children(node):
-            tags = self.tree.item(child, 'tags')
-            if 'directory' in tags:
+            if child.startswith('d'):
                 indices.extend(self._get_files_in_tree_node(child))
-            else:
-                for tag in tags:
-                    if tag.isdigit():
-                        indices.append(int(tag))
+            elif child.startswith('f'):
+                indices.append(int(child[1:]))
         return indices
-    
+
+    def _collect_subtree_indices(self, children, dir_path, indices):
+        """Collect all file indices below dir_path in a flat children map"""
+        for name, file_idx in children.get(dir_path, []):
+            if file_idx >= 0:
+                indices.append(file_idx)
+            else:
+                self._collect_subtree_indices(children, f"{dir_path}/{name}", indices)
+
     def extract_all(self):
         """Extract all files"""
         if not self.found_files:
@@ -700,93 +1083,281 @@ class QNX4ScannerGUI:
         extract_thread.daemon = True
         extract_thread.start()
     
+    @staticmethod
+    def _copy_stream(fh, out_fd, buf, read_lock=None):
+        """Copy a dissect stream to a raw output fd through a reusable buffer
+
+        Streaming keeps peak memory at the buffer size instead of the file
+        size; readinto avoids a fresh bytes allocation per chunk, and raw
+        os.write skips the BufferedWriter layer since chunks are already
+        1 MiB. When a read_lock is given, only the image reads are
+        serialized so output writes from other threads can proceed
+        concurrently.
+        """
+        readinto = getattr(fh, 'readinto', None)
+        mv = memoryview(buf)
+        while True:
+            if read_lock is not None:
+                with read_lock:
+                    n = readinto(buf) if readinto is not None else -1
+                    chunk = mv[:n] if n >= 0 else fh.read(len(buf))
+            else:
+                n = readinto(buf) if readinto is not None else -1
+                chunk = mv[:n] if n >= 0 else fh.read(len(buf))
+
+            if not len(chunk):
+                break
+            while len(chunk):
+                chunk = chunk[os.write(out_fd, chunk):]
+
+    @staticmethod
+    def _extract_runs_mmap(entry, out_fd, size, read_lock):
+        """Copy a file's data runs straight from the mmap'd image
+
+        Resolving the inode and its runlist can seek+read the shared
+        image handle (xblk chains, inode cache misses), so that happens
+        under the image lock; only the mmap slicing and the os.write
+        loop below run unlocked, since buffer slices touch no seek
+        state. Returns False when the entry or backing store does not
+        support it (wrapped/partitioned images, buffered fallback), in
+        which case the caller streams normally.
+        """
+        try:
+            with read_lock:
+                inode = entry.get().entry
+                runs = inode.dataruns()
+                mm = inode.fs.fh
+                block_size = inode.fs.block_size
+        except AttributeError:
+            return False
+
+        if not isinstance(mm, mmap.mmap):
+            return False
+
+        # All-or-nothing: bail out before writing if the runlist does
+        # not cover the full file or reaches outside the image. Damaged
+        # runlists can carry block -1 (zeroed extents) or point past a
+        # truncated image; negative offsets would silently slice from
+        # the end of the mapping, so those fall back to the stream path,
+        # which fails loudly instead
+        image_size = len(mm)
+        spans = []
+        remaining = size
+        for block, count in runs:
+            if remaining <= 0:
+                break
+            start = block * block_size
+            end = start + min(count * block_size, remaining)
+            if start < 0 or end > image_size:
+                return False
+            spans.append((start, end))
+            remaining -= end - start
+        if remaining > 0:
+            return False
+
+        # Slice runs in bounded windows: coalesced runs can span the
+        # whole file, and one slice per run would peak RSS at file size
+        window = 1024 * 1024
+        for start, end in spans:
+            while start < end:
+                data = mm[start:min(start + window, end)]
+                if not data:
+                    # Short slice despite the bounds check: rewind so the
+                    # caller's stream fallback starts from a clean file
+                    os.lseek(out_fd, 0, os.SEEK_SET)
+                    os.ftruncate(out_fd, 0)
+                    return False
+                start += len(data)
+                while data:
+                    data = data[os.write(out_fd, data):]
+        return True
+
     def _extract_files(self, file_indices, output_dir, base_path_to_strip=None, flat_extraction=False):
         """Extract files by index with visual progress (runs in background thread)
-        
+
         Args:
             file_indices: List of file indices to extract
             output_dir: Output directory path
             base_path_to_strip: Base path to strip from file paths (for folder extraction)
             flat_extraction: If True, extract files flat without subdirectories
         """
-        extracted = 0
-        failed = 0
-        total = len(file_indices)
-        
         # Reset progress bar (thread-safe)
-        self.root.after(0, lambda: self.progress_var.set(0))
-        
+        self.update_progress(0)
+
+        # Number of leading path components to drop (for folder selections)
+        strip_count = len(base_path_to_strip.strip('/').split('/')) if base_path_to_strip else 0
+
         try:
-            for idx_num, idx in enumerate(file_indices, 1):
+            # Build the worklist up front so workers only do I/O.
+            # Zero-byte inodes and duplicate output paths are filtered
+            # here: empties are touched below without a dissect round trip
+            tasks = []
+            empty_outputs = []
+            seen_paths = set()
+            for idx in file_indices:
                 if idx >= len(self.found_files):
                     continue
-                
+
                 file_info = self.found_files[idx]
-                
-                # Update progress (thread-safe)
-                progress = int((idx_num / total) * 100)
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-                self.root.after(0, lambda n=idx_num, t=total, fn=file_info['name']: 
-                    self.status_var.set(f"Extracting {n}/{t}: {fn}"))
-                self.root.after(0, lambda e=extracted, f=failed: 
-                    self.count_var.set(f"Extracted: {e}, Failed: {f}"))
-                
-                # Get path parts
-                path = file_info['path']
-                
                 if flat_extraction:
                     # Extract files flat (no subdirectories) - for individual file selections
                     output_path = os.path.join(output_dir, file_info['name'])
                 else:
                     # Strip base path if provided (for folder selections)
-                    if base_path_to_strip:
-                        relative_path = path[len(base_path_to_strip):].strip('/')
-                    else:
-                        relative_path = path.strip('/')
-                    
-                    path_parts = relative_path.split('/')
-                    
-                    # Create directory structure
-                    current_dir = output_dir
-                    for folder in path_parts[:-1]:
-                        current_dir = os.path.join(current_dir, folder)
-                        os.makedirs(current_dir, exist_ok=True)
-                    
-                    output_path = os.path.join(current_dir, path_parts[-1])
-                
+                    path_parts = file_info['parts'][strip_count:]
+                    output_path = os.path.join(output_dir, *path_parts)
+
+                if output_path in seen_paths:
+                    continue
+                seen_paths.add(output_path)
+
+                if file_info['size'] > 0:
+                    tasks.append((idx, output_path))
+                else:
+                    empty_outputs.append(output_path)
+
+            # Create every output directory once (deduped) instead of
+            # re-running makedirs for each file's parent chain
+            if not flat_extraction:
+                for parent in {os.path.dirname(p) for p in seen_paths}:
+                    os.makedirs(parent, exist_ok=True)
+
+            # Zero-byte files: just touch the outputs
+            for output_path in empty_outputs:
+                open(output_path, 'wb').close()
+
+            # Read in inode order: on-disk layout roughly follows inode
+            # numbers, so this turns random image seeks into a sweep
+            tasks.sort(key=lambda t: self.found_files[t[0]].get('inode', 0))
+
+            total = len(tasks) + len(empty_outputs)
+            counters = {'done': len(empty_outputs), 'extracted': len(empty_outputs), 'failed': 0}
+            counter_lock = threading.Lock()
+            # Image reads serialize on the shared lock; output writes
+            # from the other workers overlap freely
+            read_lock = self._image_lock
+            thread_local = threading.local()
+
+            def finish_one(ok, name):
+                with counter_lock:
+                    counters['done'] += 1
+                    counters['extracted' if ok else 'failed'] += 1
+                    done = counters['done']
+                    e_count = counters['extracted']
+                    f_count = counters['failed']
+
+                # The UI pump coalesces these; no per-file Tk events
+                self.update_progress(int((done / total) * 100) if total else 100)
+                self.update_status(f"Extracting {done}/{total}: {name}")
+                self.update_count(f"Extracted: {e_count}, Failed: {f_count}")
+
+            # Small files go through a bounded write queue drained by
+            # dedicated writer threads: the image-side workers keep the
+            # disk image busy while open/write/close of thousands of tiny
+            # outputs happens off to the side in one-shot os.write calls
+            write_queue = queue.Queue(maxsize=64)
+            write_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+
+            def write_small():
+                while True:
+                    item = write_queue.get()
+                    if item is None:
+                        break
+                    output_path, data, name, path = item
+
+                    ok = True
+                    try:
+                        fd = os.open(output_path, write_flags)
+                        try:
+                            while data:
+                                data = data[os.write(fd, data):]
+                        finally:
+                            os.close(fd)
+                    except Exception as e:
+                        ok = False
+                        print(f"Failed to extract {path}: {e}")
+                    finish_one(ok, name)
+
+            def extract_one(task):
+                idx, output_path = task
+                file_info = self.found_files[idx]
+
+                # One reusable copy buffer per worker thread
+                buf = getattr(thread_local, 'buf', None)
+                if buf is None:
+                    buf = thread_local.buf = bytearray(1024 * 1024)
+
                 try:
-                    # Read file using dissect
-                    with file_info['entry'].open() as fh:
-                        data = fh.read()
-                    
-                    # Write to output
-                    with open(output_path, 'wb') as out:
-                        out.write(data)
-                    
-                    extracted += 1
-                    
+                    if file_info['size'] <= len(buf):
+                        # Small file: one read under the lock, then hand
+                        # the payload to the writer threads
+                        with read_lock:
+                            fh = file_info['entry'].open()
+                            data = fh.read()
+                            fh.close()
+                        write_queue.put((output_path, data,
+                                         file_info['name'], file_info['path']))
+                        return
+
+                    fd = os.open(output_path, write_flags)
+                    try:
+                        # Large file: copy runs from the mmap directly if
+                        # possible, else stream under the image lock
+                        if not self._extract_runs_mmap(file_info['entry'], fd,
+                                                       file_info['size'], read_lock):
+                            with read_lock:
+                                fh = file_info['entry'].open()
+                            with fh:
+                                self._copy_stream(fh, fd, buf, read_lock=read_lock)
+                    finally:
+                        os.close(fd)
                 except Exception as e:
-                    failed += 1
-                    print(f"Failed to extract {path}: {e}")
-            
-            # Final progress (thread-safe)
-            self.root.after(0, lambda: self.progress_var.set(100))
-            
+                    print(f"Failed to extract {file_info['path']}: {e}")
+                    finish_one(False, file_info['name'])
+                    return
+
+                finish_one(True, file_info['name'])
+
+            writers = [threading.Thread(target=write_small, daemon=True)
+                       for _ in range(2)]
+            for writer in writers:
+                writer.start()
+
+            max_workers = min(8, (os.cpu_count() or 4) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for _ in executor.map(extract_one, tasks):
+                    pass
+
+            # Drain the writers before reporting totals
+            for _ in writers:
+                write_queue.put(None)
+            for writer in writers:
+                writer.join()
+
+            extracted = counters['extracted']
+            failed = counters['failed']
+
+            # Final progress and status go through the mailbox, after the
+            # workers' last per-file updates, so the pump applies the
+            # completion text instead of clobbering it with stale
+            # "Extracting N/N" entries on its next tick
+            self.update_progress(100)
+            self.update_status("✓ Extraction complete")
+            self.update_count(f"✓ {extracted} files extracted, {failed} failed")
+
             # Show completion message (thread-safe)
             def show_completion():
                 if failed > 0:
-                    messagebox.showwarning("Extraction Complete", 
+                    messagebox.showwarning("Extraction Complete",
                         f"Extracted {extracted}/{total} files\nFailed: {failed} files")
                 else:
-                    messagebox.showinfo("Success", 
+                    messagebox.showinfo("Success",
                         f"Successfully extracted all {extracted} files with complete data integrity!")
-                
-                self.status_var.set("✓ Extraction complete")
-                self.count_var.set(f"✓ {extracted} files extracted, {failed} failed")
+
                 self.scan_button.config(state='normal')
-            
+
             self.root.after(0, show_completion)
-            
+
         except Exception as e:
             def show_error():
                 messagebox.showerror("Error", f"Extraction failed: {str(e)}")
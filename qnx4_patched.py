@@ -9,7 +9,9 @@
 
 from __future__ import annotations
 
+import mmap
 import stat
+import weakref
 from functools import cached_property, lru_cache
 from typing import TYPE_CHECKING, BinaryIO
 
@@ -29,23 +31,48 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
     from datetime import datetime
 
+# Optional: vectorized directory-entry filtering on large directories
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if np is not None:
+    # First name byte and status byte bracket the 64-byte entry
+    _DIR_ENTRY_DTYPE = np.dtype([("first", "u1"), ("pad", "V62"), ("status", "u1")])
+
 
 class QNX4:
     """QNX4 filesystem implementation.
 
     Args:
         fh: A file-like object of the volume containing the filesystem.
+        inode_cache_size: Maximum number of inode objects to keep cached.
     """
 
-    def __init__(self, fh: BinaryIO):
+    def __init__(self, fh: BinaryIO, inode_cache_size: int = 16384):
         if not _is_qnx4(fh):
             raise InvalidFilesystemError("Invalid QNX4 filesystem")
 
         self.fh = fh
+
+        # Memory-map plain files so inode/directory reads become slices
+        # out of the page cache instead of seek+read syscall pairs.
+        # Wrapped streams (partition views) have no usable fileno and
+        # keep the original handle.
+        if not isinstance(fh, mmap.mmap):
+            try:
+                self.fh = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except (AttributeError, ValueError, OSError):
+                pass
+
         self.block_size = c_qnx4.QNX4_BLOCK_SIZE
-        self.inode = lru_cache(1024)(self.inode)
+        self.inode = lru_cache(inode_cache_size)(self.inode)
+        self._read_lfn = lru_cache(256)(self._read_lfn)
+        self._read_inode_block = lru_cache(512)(self._read_inode_block)
 
         self.root = self.inode(c_qnx4.QNX4_ROOT_INO * c_qnx4.QNX4_INODES_PER_BLOCK)
+        self._path_index: dict[str, INode4] | None = None
 
     def inode(self, inum: int) -> INode4:
         """Return an inode object for the given inode number.
@@ -55,6 +82,25 @@ class QNX4:
         """
         return INode4(self, inum)
 
+    def _read_lfn(self, blk: int) -> str:
+        """Read a long-filename block and return the decoded name.
+
+        Directories with many long-filename entries re-reference the same
+        blocks, so the parsed and decoded result is LRU cached per
+        filesystem.
+        """
+        self.fh.seek((blk - 1) * self.block_size)
+        return _decode_name(c_qnx4.qnx4_longfilename_entry(self.fh).lfn_name)
+
+    def _read_inode_block(self, block: int) -> bytes:
+        """Read a whole block of inode entries.
+
+        Consecutive inodes share blocks, so results are LRU cached and
+        individual entries sliced out by the caller.
+        """
+        self.fh.seek(block * self.block_size)
+        return self.fh.read(self.block_size)
+
     def get(self, path: str | int, node: INode4 | None = None) -> INode4:
         """Return an inode object for the given path or inode number.
 
@@ -65,6 +111,13 @@ class QNX4:
         if isinstance(path, int):
             return self.inode(path)
 
+        # Absolute lookups resolve in O(1) once the index is built;
+        # misses (e.g. paths through symlinks) fall back to the walk
+        if node is None and self._path_index is not None:
+            hit = self._path_index.get(path.strip("/"))
+            if hit is not None:
+                return hit
+
         node = node or self.root
         parts = path.split("/")
 
@@ -87,6 +140,28 @@ class QNX4:
 
         return node
 
+    def build_path_index(self) -> dict[str, INode4]:
+        """Walk the filesystem once and index every path to its inode.
+
+        The filesystem is read-only, so the index never goes stale.
+        After this, :meth:`get` resolves absolute paths with one dict
+        lookup instead of a per-component directory walk.
+        """
+        index = {"": self.root}
+        stack = [("", self.root)]
+        while stack:
+            prefix, directory = stack.pop()
+            for name, entry in directory.iterdir():
+                if name in (".", ".."):
+                    continue
+                path = f"{prefix}/{name}" if prefix else name
+                index[path] = entry
+                if entry.is_dir() and not entry.is_symlink():
+                    stack.append((path, entry))
+
+        self._path_index = index
+        return index
+
 
 class INode4:
     def __init__(self, fs: QNX4, inum: int):
@@ -98,8 +173,9 @@ class INode4:
 
     def _read_inode(self) -> c_qnx4.qnx4_inode_entry:
         block, index = divmod(self.inum, c_qnx4.QNX4_INODES_PER_BLOCK)
-        self.fs.fh.seek((block * self.fs.block_size) + (index * c_qnx4.QNX4_DIR_ENTRY_SIZE))
-        return c_qnx4.qnx4_inode_entry(self.fs.fh)
+        offset = index * c_qnx4.QNX4_DIR_ENTRY_SIZE
+        buf = self.fs._read_inode_block(block)
+        return c_qnx4.qnx4_inode_entry(buf[offset : offset + c_qnx4.QNX4_DIR_ENTRY_SIZE])
 
     @cached_property
     def inode(self) -> c_qnx4.qnx4_inode_entry:
@@ -212,46 +288,86 @@ class INode4:
 
     def listdir(self) -> dict[str, INode4]:
         """Return a directory listing."""
+        return self._dir_map
+
+    @cached_property
+    def _dir_map(self) -> dict[str, INode4]:
+        """Directory listing as a mapping, built once per inode object."""
         return dict(self.iterdir())
 
+    @cached_property
+    def _dir_entries(self) -> list[tuple[str, INode4]]:
+        """Parsed directory entries, read once per inode object."""
+        return list(self._iterdir_raw())
+
     def iterdir(self) -> Iterator[tuple[str, INode4]]:
         """Iterate directory contents."""
+        yield from self._dir_entries
+
+    def _iterdir_raw(self) -> Iterator[tuple[str, INode4]]:
+        """Read and parse directory contents from disk."""
         if not self.is_dir():
             raise NotADirectoryError(f"{self!r} is not a directory")
 
-        fh = self.fs.fh
-        for block, size in self._iter_chain():
-            for i in range(c_qnx4.QNX4_INODES_PER_BLOCK * size):
-                fh.seek((block * self.fs.block_size) + (i * c_qnx4.QNX4_DIR_ENTRY_SIZE))
-
-                buf = fh.read(c_qnx4.QNX4_DIR_ENTRY_SIZE)
-                if len(buf) != c_qnx4.QNX4_DIR_ENTRY_SIZE:
-                    raise Error("Invalid QNX4 directory entry")
-
-                status = buf[-1]
-
-                if not buf[0]:
-                    continue
-
-                if not status & (c_qnx4.QNX4_FILE_USED | c_qnx4.QNX4_FILE_LINK):
-                    continue
-
-                if status & c_qnx4.QNX4_FILE_LINK:
-                    link_info = c_qnx4.qnx4_link_info(buf)
-                    inum = ((link_info.dl_inode_blk - 1) * c_qnx4.QNX4_INODES_PER_BLOCK) + link_info.dl_inode_ndx
+        # Bind hot attribute chains once; each c_qnx4/self.fs lookup is
+        # several dict probes that would otherwise run per entry
+        fs = self.fs
+        fh = fs.fh
+        block_size = fs.block_size
+        inode = fs.inode
+        read_lfn = fs._read_lfn
+        entries_per_block = c_qnx4.QNX4_INODES_PER_BLOCK
+        entry_size = c_qnx4.QNX4_DIR_ENTRY_SIZE
+        used_or_link = c_qnx4.QNX4_FILE_USED | c_qnx4.QNX4_FILE_LINK
+        link_flag = c_qnx4.QNX4_FILE_LINK
+        name_max = c_qnx4.QNX4_NAME_MAX
+        short_name_max = c_qnx4.QNX4_SHORT_NAME_MAX
+        link_info_struct = c_qnx4.qnx4_link_info
+
+        for block, size in self._coalesced_chain():
+            # One read per extent instead of one seek+read per 64-byte
+            # entry; the entries are sliced out of the buffer below
+            fh.seek(block * block_size)
+            num_entries = entries_per_block * size
+            extent = fh.read(num_entries * entry_size)
+            if len(extent) != num_entries * entry_size:
+                raise Error("Invalid QNX4 directory entry")
+
+            # Select live entries up front - most slots in a directory
+            # extent are empty or deleted - so only survivors get sliced
+            # and parsed. NumPy does this as one vector op when available.
+            if np is not None:
+                arr = np.frombuffer(extent, dtype=_DIR_ENTRY_DTYPE, count=num_entries)
+                candidates = np.flatnonzero(
+                    (arr["first"] != 0) & ((arr["status"] & used_or_link) != 0)
+                ).tolist()
+            else:
+                candidates = [
+                    i
+                    for i in range(num_entries)
+                    if extent[i * entry_size] and extent[(i + 1) * entry_size - 1] & used_or_link
+                ]
+
+            for i in candidates:
+                # Index into the extent buffer directly; the only full
+                # 64-byte copy left is the one cstruct needs for links
+                off = i * entry_size
+                status = extent[off + entry_size - 1]
+
+                if status & link_flag:
+                    link_info = link_info_struct(extent[off : off + entry_size])
+                    inum = ((link_info.dl_inode_blk - 1) * entries_per_block) + link_info.dl_inode_ndx
 
                     if link_info.dl_lfn_blk:
-                        fh.seek((link_info.dl_lfn_blk - 1) * self.fs.block_size)
-                        lfn_entry = c_qnx4.qnx4_longfilename_entry(fh)
-                        name = lfn_entry.lfn_name
+                        # Already null-stripped and decoded by the cache
+                        name = read_lfn(link_info.dl_lfn_blk)
                     else:
-                        name = buf[: c_qnx4.QNX4_NAME_MAX]
+                        name = _decode_name(extent[off : off + name_max])
                 else:
-                    inum = (block * c_qnx4.QNX4_INODES_PER_BLOCK) + i
-                    name = buf[: c_qnx4.QNX4_SHORT_NAME_MAX]
+                    inum = (block * entries_per_block) + i
+                    name = _decode_name(extent[off : off + short_name_max])
 
-                name = name.split(b"\x00")[0].decode(errors="surrogateescape")
-                yield name, self.fs.inode(inum)
+                yield name, inode(inum)
 
     def _iter_chain(self) -> Iterator[tuple[int, int]]:
         """Iterate the extent chain."""
@@ -277,15 +393,66 @@ class INode4:
 
             xblk_num = xblk.xblk_next_xblk
 
+    def _coalesced_chain(self) -> Iterator[tuple[int, int]]:
+        """Iterate the extent chain with physically adjacent extents merged.
+
+        Fragmented files often carry runs that happen to be contiguous
+        on disk; merging them means one read where RunlistStream would
+        otherwise issue one per extent.
+        """
+        chain = self._iter_chain()
+        try:
+            cur_blk, cur_size = next(chain)
+        except StopIteration:
+            return
+
+        for blk, size in chain:
+            if blk == cur_blk + cur_size:
+                cur_size += size
+            else:
+                yield cur_blk, cur_size
+                cur_blk, cur_size = blk, size
+
+        yield cur_blk, cur_size
+
+    @cached_property
+    def _dataruns(self) -> list[tuple[int, int]]:
+        """Materialized runlist, built once per inode object."""
+        return list(self._coalesced_chain())
+
     def dataruns(self) -> list[tuple[int, int]]:
         """Return the data runlist."""
-        return list(self._iter_chain())
+        return self._dataruns
 
     def open(self) -> BinaryIO:
         """Return a file-like object for reading the file."""
         return RunlistStream(self.fs.fh, self.dataruns(), self.size, self.fs.block_size)
 
 
+def _decode_name(raw: bytes) -> str:
+    """Null-strip and decode an on-disk name."""
+    return raw.split(b"\x00")[0].decode(errors="surrogateescape")
+
+
+# Handles that already passed the signature check; re-validating the
+# same handle (rescan workflows) then skips the seek+read
+_VALIDATED = weakref.WeakSet()
+
+
 def _is_qnx4(fh: BinaryIO) -> bool:
+    try:
+        if fh in _VALIDATED:
+            return True
+    except TypeError:
+        pass  # Not weak-referenceable (e.g. mmap); just re-check
+
     fh.seek(c_qnx4.QNX4_BLOCK_SIZE)
-    return fh.read(16) == b"/" + b"\x00" * 15
+    valid = fh.read(16) == b"/" + b"\x00" * 15
+
+    if valid:
+        try:
+            _VALIDATED.add(fh)
+        except TypeError:
+            pass
+
+    return valid